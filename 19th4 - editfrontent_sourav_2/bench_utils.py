@@ -0,0 +1,9 @@
+"""Helpers shared by the benchmark scripts (benchmark.py, login_benchmark.py, evaluate_matchers.py)."""
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
@@ -0,0 +1,248 @@
+"""
+Synthetic load benchmark for the recommendation, browsing, search and dashboard routes.
+
+Seeds a throw-away SQLite database shaped like populate_db.py's data (companies,
+roles and skills come from internship_posted_data.csv), drives the Flask test
+client against each route and prints / writes a JSON report with p50/p95/p99
+latency, SQL statements per request and peak memory per route.
+
+    python benchmark.py --students 5000 --jobs 20000 --requests 200 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+parser = argparse.ArgumentParser(description="Benchmark the recommendation and dashboard routes.")
+parser.add_argument('--students', type=int, default=1000)
+parser.add_argument('--projects-per-student', type=int, default=2)
+parser.add_argument('--companies', type=int, default=100)
+parser.add_argument('--jobs', type=int, default=5000)
+parser.add_argument('--applications-per-student', type=int, default=3)
+parser.add_argument('--requests', type=int, default=50, help="measured requests per route")
+parser.add_argument('--csv', default='internship_posted_data.csv', help="CSV used for job roles and skills")
+parser.add_argument('--database', default=None, help="SQLite file to (re)create and seed (default: a temporary file)")
+parser.add_argument('--output', default=None, help="also write the JSON report to this file")
+parser.add_argument('--seed', type=int, default=42)
+args = parser.parse_args()
+
+# create_app() reads DATABASE_URL; point it at SQLite
+database_path = args.database or os.path.join(tempfile.mkdtemp(prefix='thinkbolts-bench-'), 'bench.db')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.abspath(database_path)}"
+
+import pandas as pd
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db, Student, StudentProject, Company, JobPosting, JobApplication, \
+    BPUT_COLLEGES, INDIAN_IT_CITIES, rebuild_search_index, search_terms
+from populate_db import parse_skills, index_job_skills
+from bench_utils import percentile
+
+app = create_app()
+recommendation_cache = app.extensions['recommendation_cache']
+
+CHUNK_SIZE = 5000
+
+
+def insert_in_chunks(model, rows):
+    for start in range(0, len(rows), CHUNK_SIZE):
+        db.session.bulk_insert_mappings(model, rows[start:start + CHUNK_SIZE])
+        db.session.commit()
+
+
+def seed_database(rng):
+    """Fills a fresh database with the configured number of rows."""
+    df = pd.read_csv(args.csv)
+    cgpa_column = 'cgpa_minimum' if 'cgpa_minimum' in df.columns else 'cgpa_required'
+    templates = [(row.role, parse_skills(row.skills), float(getattr(row, cgpa_column)))
+                 for row in df.itertuples(index=False)]
+    vocabulary = sorted({skill for _, skills, _ in templates for skill in skills})
+    company_names = list(dict.fromkeys(df['company'].tolist()))
+    password_hash = generate_password_hash('pass1234')
+
+    db.drop_all()
+    db.create_all()
+
+    insert_in_chunks(Company, [{
+        'company_name': company_names[i] if i < len(company_names) else f"Company {i}",
+        'email': f"company{i}@bench.in",
+        'password_hash': password_hash,
+    } for i in range(args.companies)])
+
+    jobs = []
+    for i in range(args.jobs):
+        role, skills, cgpa = templates[i % len(templates)]
+        jobs.append({
+            'company_id': i % args.companies + 1,
+            'job_role': role,
+            'required_skills': skills,
+            'location': rng.choice(INDIAN_IT_CITIES),
+            'cgpa_required': cgpa,
+            'salary_min': rng.randrange(200000, 600000, 10000),
+            'salary_max': rng.randrange(600000, 2000000, 10000),
+            'description': f"Seeking a talented {role} to join our team. Key skills include {', '.join(skills)}.",
+        })
+    insert_in_chunks(JobPosting, jobs)
+    index_job_skills(0, {})
+    db.session.commit()
+
+    insert_in_chunks(Student, [{
+        'full_name': f"Student {i}",
+        'email': f"student{i}@bench.in",
+        'college': BPUT_COLLEGES[i % len(BPUT_COLLEGES)],
+        'registration_number': f"B{i:08d}",
+        'password_hash': password_hash,
+        'cgpa': round(rng.uniform(5.5, 9.9), 2),
+        'skills': rng.sample(vocabulary, min(6, len(vocabulary))),
+    } for i in range(args.students)])
+
+    insert_in_chunks(StudentProject, [{
+        'student_id': student_id,
+        'project_title': f"Project {n}",
+        'description': f"Built with {', '.join(rng.sample(vocabulary, min(3, len(vocabulary))))}",
+    } for student_id in range(1, args.students + 1) for n in range(args.projects_per_student)])
+
+    applications = []
+    for student_id in range(1, args.students + 1):
+        for job_id in rng.sample(range(1, args.jobs + 1), min(args.applications_per_student, args.jobs)):
+            applications.append({'student_id': student_id, 'job_id': job_id, 'status': 'Applied'})
+    insert_in_chunks(JobApplication, applications)
+    rebuild_search_index(CHUNK_SIZE)
+
+
+def scenarios(rng):
+    """(name, make_request, before_each) for every measured route; make_request returns (session, url)."""
+    def student(url):
+        return lambda: ({'logged_in': True, 'role': 'student', 'user_id': rng.randint(1, args.students)}, url())
+
+    def applicants(query=''):
+        def make_request():
+            job_id = rng.randint(1, args.jobs)
+            # Jobs are assigned to companies round-robin by seed_database()
+            company_id = (job_id - 1) % args.companies + 1
+            return {'logged_in': True, 'role': 'company', 'user_id': company_id}, f"/applicants/{job_id}{query}"
+        return make_request
+
+    # Search box queries: the first few letters of a word from a job role or a skill
+    words = sorted({word for (role,) in db.session.query(JobPosting.job_role).distinct()
+                    for word in search_terms(role) if len(word) >= 4})
+    def search(kind, role):
+        def make_request():
+            query = ' '.join(word[:rng.randint(3, len(word))] for word in rng.sample(words, rng.randint(1, 2)))
+            return {'logged_in': True, 'role': role, 'user_id': 1}, f"/api/search?type={kind}&q={query}"
+        return make_request
+
+    return [
+        ('student_profile (cold cache)', student(lambda: '/student_profile'), recommendation_cache.clear),
+        ('student_profile (warm cache)',
+         lambda: ({'logged_in': True, 'role': 'student', 'user_id': 1}, '/student_profile'), None),
+        ('all_internship_opportunity (recommended)', student(lambda: '/all_internship_opportunity'),
+         recommendation_cache.clear),
+        ('all_internship_opportunity (location)',
+         student(lambda: f"/all_internship_opportunity?location={rng.choice(INDIAN_IT_CITIES)}"), None),
+        ('company_profile', lambda: ({'logged_in': True, 'role': 'company',
+                                      'user_id': rng.randint(1, args.companies)}, '/company_profile'), None),
+        ('applicants (ranked)', applicants(), None),
+        ('applicants (applied order)', applicants('?sort=applied'), None),
+        ('candidates (all eligible students)', applicants('?pool=eligible'), None),
+        ('search jobs (prefix)', search('jobs', 'student'), None),
+        ('search students (prefix)', search('students', 'company'), None),
+        ('college_dashboard', lambda: ({'logged_in': True, 'role': 'college', 'user_id': 1, 'username': 'bench',
+                                        'college_name': rng.choice(BPUT_COLLEGES)}, '/college_dashboard'), None),
+        ('university_dashboard', lambda: ({'logged_in': True, 'role': 'university', 'user_id': 1,
+                                           'username': 'bench'}, '/university_dashboard'), None),
+    ]
+
+
+def run_scenario(client, statements, make_request, before_each):
+    def one_request():
+        session_values, url = make_request()
+        with client.session_transaction() as sess:
+            sess.clear()
+            sess.update(session_values)
+        if before_each:
+            before_each()
+        statements[0] = 0
+        started = time.perf_counter()
+        response = client.get(url)
+        elapsed = (time.perf_counter() - started) * 1000
+        return response.status_code, elapsed, statements[0]
+
+    one_request()  # Warm-up: builds the job index, fills connection pools, compiles templates
+
+    latencies, queries, statuses = [], [], set()
+    for _ in range(args.requests):
+        status, elapsed, count = one_request()
+        latencies.append(elapsed)
+        queries.append(count)
+        statuses.add(status)
+
+    tracemalloc.start()
+    one_request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'status_codes': sorted(statuses),
+        'mean_ms': round(sum(latencies) / len(latencies), 3),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'queries_per_request': round(sum(queries) / len(queries), 2),
+        'max_queries_per_request': max(queries),
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def main():
+    rng = random.Random(args.seed)
+    report = {
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'database')},
+        'environment': {'python': sys.version.split()[0], 'platform': platform.platform()},
+        'results': {},
+    }
+
+    with app.app_context():
+        started = time.perf_counter()
+        seed_database(rng)
+        report['seed_seconds'] = round(time.perf_counter() - started, 2)
+        print(f"Seeded {database_path} in {report['seed_seconds']}s", file=sys.stderr)
+
+        statements = [0]
+
+        def count_statement(*_):
+            statements[0] += 1
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+        measured = scenarios(rng)
+
+    # No app context is active from here on, so every request pushes its own, as in production:
+    # a fresh `g` and database session per request instead of one identity map shared by all
+    client = app.test_client()
+    for name, make_request, before_each in measured:
+        report['results'][name] = run_scenario(client, statements, make_request, before_each)
+        result = report['results'][name]
+        print(f"{name:45s} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+              f"p99 {result['p99_ms']:8.2f}ms  {result['queries_per_request']:6.1f} queries", file=sys.stderr)
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report['peak_rss_mb'] = round(max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
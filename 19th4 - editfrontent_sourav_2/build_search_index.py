@@ -0,0 +1,32 @@
+import argparse
+import time
+
+# This import will work correctly when you run it from your local machine
+from app import create_app, db, SearchDocument, rebuild_search_index
+
+
+def build_search_index(batch_size=1000):
+    """
+    Creates the search tables if needed (with the FTS5 table and its triggers on SQLite)
+    and rewrites the search document of every job posting and student.
+    """
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        rebuild_search_index(batch_size)
+        if db.engine.dialect.name == 'sqlite':
+            # Merges the FTS5 b-tree segments written batch by batch into one
+            db.session.execute(db.text("INSERT INTO search_fts(search_fts) VALUES ('optimize')"))
+            db.session.commit()
+        counts = dict(db.session.query(SearchDocument.kind, db.func.count()).group_by(SearchDocument.kind).all())
+        elapsed = time.perf_counter() - started
+        print(f"Indexed {counts.get('job', 0)} job postings and {counts.get('student', 0)} students in {elapsed:.2f}s.")
+        print("\nSearch index rebuilt! ✅")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Rebuild the full-text search index of jobs and students.")
+    parser.add_argument('--batch-size', type=int, default=1000, help="rows indexed per transaction")
+    args = parser.parse_args()
+    build_search_index(batch_size=args.batch_size)
@@ -0,0 +1,122 @@
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+from flask import current_app
+from sqlalchemy.orm import selectinload
+
+# This import will work correctly when you run it from your local machine
+from app import create_app, db, Student, JobPosting, normalize_skill
+from recommender import make_matcher, student_document, hybrid_scores, top_k
+from bench_utils import percentile
+
+
+def skill_relevance(student_skills, job_skills):
+    """Graded relevance used as ground truth: the share of the job's required skills the student has."""
+    return len(student_skills & job_skills) / len(job_skills) if job_skills else 0.0
+
+
+def ndcg(gains, ideal_gains):
+    discounts = 1 / np.log2(np.arange(2, len(ideal_gains) + 2))
+    ideal = float(np.sum(np.asarray(ideal_gains) * discounts))
+    if not ideal:
+        return 0.0
+    return float(np.sum(np.asarray(gains) * discounts[:len(gains)])) / ideal
+
+
+def rank(matcher, student, k):
+    """The student's top K (job_id, score) under `matcher`, without excluding jobs already applied to."""
+    job_ids, cgpa_required, content_scores = matcher.score(student_document(student))
+    if not len(job_ids):
+        return []
+    scores = hybrid_scores(content_scores, student.cgpa, cgpa_required)
+    return [(int(job_ids[i]), float(scores[i])) for i in top_k(scores, k)]
+
+
+def evaluate(backend, students, job_skills, k):
+    matcher = make_matcher(current_app.config, backend)
+    started = time.perf_counter()
+    matcher.rebuild()
+    build_seconds = time.perf_counter() - started
+
+    latencies, ndcgs, hits, recalls = [], [], [], []
+    for student in students:
+        skills = {normalize_skill(s) for s in student.skills or []}
+        started = time.perf_counter()
+        scored = rank(matcher, student, k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        ranked = [job_id for job_id, _ in scored]
+
+        relevance = sorted((skill_relevance(skills, job) for job in job_skills.values()), reverse=True)[:k]
+        ndcgs.append(ndcg([skill_relevance(skills, job_skills[job_id]) for job_id in ranked], relevance))
+
+        applied = {application.job_id for application in student.applications}
+        if applied:
+            hits.append(bool(applied & set(ranked)))
+
+        if matcher.ann is not None:
+            # Recall of the approximate top K against an exact scan over every job. Postings often
+            # tie, so an approximate hit counts when it scores at least as well as the exact K-th job
+            ann, matcher.ann = matcher.ann, None
+            exact = rank(matcher, student, k)
+            matcher.ann = ann
+            if exact:
+                cutoff = exact[-1][1] - 1e-9
+                recalls.append(sum(score >= cutoff for _, score in scored) / len(exact))
+
+    latencies.sort()
+    return {
+        'jobs': len(matcher.job_ids),
+        'build_seconds': round(build_seconds, 3),
+        'ann': matcher.ann is not None,
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        f'ndcg@{k}': round(float(np.mean(ndcgs)), 4) if ndcgs else None,
+        f'application_hit_rate@{k}': round(float(np.mean(hits)), 4) if hits else None,
+        f'ann_recall@{k}': round(float(np.mean(recalls)), 4) if recalls else None,
+    }
+
+
+def evaluate_matchers(backends, sample_size=200, k=10, ann_min_jobs=None, seed=42):
+    """
+    Compares matcher backends on the same students: query latency, nDCG@K against
+    skill-overlap relevance, hit rate of the jobs students actually applied to and,
+    for backends using an ANN index, recall against the exact scan.
+    """
+    app = create_app({'ANN_MIN_JOBS': ann_min_jobs} if ann_min_jobs is not None else None)
+    report = {}
+    with app.app_context():
+        db.create_all()  # Creates the job_embedding table on first run
+        student_ids = [student_id for (student_id,) in db.session.query(Student.id)]
+        sample = random.Random(seed).sample(student_ids, min(sample_size, len(student_ids)))
+        students = Student.query.options(
+            selectinload(Student.projects), selectinload(Student.applications)
+        ).filter(Student.id.in_(sample)).all()
+        job_skills = {job_id: {normalize_skill(s) for s in skills or []}
+                      for job_id, skills in db.session.query(JobPosting.id, JobPosting.required_skills)}
+        print(f"Evaluating {', '.join(backends)} on {len(students)} students and {len(job_skills)} jobs...")
+
+        for backend in backends:
+            report[backend] = evaluate(backend, students, job_skills, k)
+            result = report[backend]
+            print(f"{backend:22s} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  "
+                  f"nDCG@{k} {result[f'ndcg@{k}']}  hit@{k} {result[f'application_hit_rate@{k}']}  "
+                  f"ANN recall@{k} {result[f'ann_recall@{k}']}  (build {result['build_seconds']}s)")
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare recommendation backends offline.")
+    parser.add_argument('--backends', default='tfidf,hashed_ngram', help="comma-separated RECOMMENDATION_BACKEND values")
+    parser.add_argument('--students', type=int, default=200, help="students sampled for the comparison")
+    parser.add_argument('--k', type=int, default=10, help="recommendations per student")
+    parser.add_argument('--ann-min-jobs', type=int, default=None, help="override ANN_MIN_JOBS, e.g. 0 to force the ANN index")
+    parser.add_argument('--output', default=None, help="also write the JSON report to this file")
+    args = parser.parse_args()
+    report = evaluate_matchers([b.strip() for b in args.backends.split(',') if b.strip()],
+                               sample_size=args.students, k=args.k, ann_min_jobs=args.ann_min_jobs)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(json.dumps(report, indent=2) + '\n')
@@ -0,0 +1,89 @@
+"""
+Cold-start benchmark: starts fresh Python processes, as a new gunicorn worker or CLI script
+would, imports the given modules (and calls the factory of `module:factory` entries, e.g.
+app:create_app) and reports the import time, the process wall time and the peak RSS of each,
+plus which heavy libraries ended up loaded.
+
+    python import_benchmark.py --runs 5 --output imports.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Runs inside each child process; prints one JSON line
+CHILD = r"""
+import json, resource, sys, time
+started = time.perf_counter()
+for entry in sys.argv[1].split(','):
+    module, _, factory = entry.partition(':')
+    __import__(module)
+    if factory:
+        getattr(sys.modules[module], factory)()
+elapsed = time.perf_counter() - started
+# ru_maxrss is in KiB on Linux and bytes on macOS
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+print(json.dumps({
+    'import_seconds': elapsed,
+    'rss_mb': rss,
+    'loaded': [name for name in ('numpy', 'scipy', 'sklearn', 'pandas', 'pyarrow') if name in sys.modules],
+}))
+"""
+
+SCENARIOS = [
+    ('models (CLI scripts)', 'models'),
+    ('app (web worker start)', 'app:create_app'),
+    ('app + recommender (first recommendation)', 'app:create_app,recommender'),
+]
+
+
+def run_once(modules):
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD, modules], check=True, capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['process_seconds'] = time.perf_counter() - started
+    return result
+
+
+def measure(modules, runs):
+    run_once(modules)  # Warm-up: writes the .pyc files and fills the OS page cache
+    results = [run_once(modules) for _ in range(runs)]
+    summary = {'modules': modules.split(','), 'loaded': results[-1]['loaded']}
+    for key in ('import_seconds', 'process_seconds', 'rss_mb'):
+        values = [result[key] for result in results]
+        summary[f'{key}_median'] = round(statistics.median(values), 4 if key != 'rss_mb' else 1)
+        summary[f'{key}_max'] = round(max(values), 4 if key != 'rss_mb' else 1)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time and memory of the app modules.")
+    parser.add_argument('--runs', type=int, default=5, help="fresh processes per scenario")
+    parser.add_argument('--output', default=None, help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {
+        'config': {'runs': args.runs},
+        'environment': {'python': sys.version.split()[0], 'platform': platform.platform()},
+        'results': {},
+    }
+    for name, modules in SCENARIOS:
+        result = report['results'][name] = measure(modules, args.runs)
+        print(f"{name:45s} import {result['import_seconds_median'] * 1000:8.1f}ms  "
+              f"process {result['process_seconds_median'] * 1000:8.1f}ms  RSS {result['rss_mb_median']:7.1f}MB  "
+              f"loaded: {', '.join(result['loaded']) or '-'}", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Request, SQL and recommendation-stage metrics, rendered by the /metrics route.
+init_app() gives the app its RequestMetrics and installs the per-request hooks; the SQL
+listeners cover every engine.
+"""
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+class RequestMetrics:
+    """
+    Request and SQL metrics of one app, kept in app.extensions['request_metrics'] and rendered
+    for Prometheus by /metrics. Counters are per worker process; Prometheus sums them across workers.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)            # (endpoint, method, status) -> count
+        self.duration_buckets = defaultdict(lambda: [0] * len(self.BUCKETS))
+        self.duration_sum = defaultdict(float)      # endpoint -> seconds
+        self.duration_count = defaultdict(int)
+        self.sql_statements = defaultdict(int)      # endpoint -> statements
+        self.db_seconds = defaultdict(float)        # endpoint -> seconds spent in the database
+        self.stage_seconds = defaultdict(float)     # recommendation stage -> seconds
+        self.stage_count = defaultdict(int)
+
+    def observe_request(self, endpoint, method, status, seconds, statements, db_seconds):
+        with self._lock:
+            self.requests[(endpoint, method, status)] += 1
+            buckets = self.duration_buckets[endpoint]
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+            self.duration_sum[endpoint] += seconds
+            self.duration_count[endpoint] += 1
+            self.sql_statements[endpoint] += statements
+            self.db_seconds[endpoint] += db_seconds
+
+    def observe_stage(self, stage, seconds):
+        with self._lock:
+            self.stage_seconds[stage] += seconds
+            self.stage_count[stage] += 1
+
+    def render(self):
+        """Prometheus text exposition format."""
+        def label(value):
+            return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+        lines = []
+        with self._lock:
+            lines += ['# HELP thinkbolts_requests_total HTTP requests handled.',
+                      '# TYPE thinkbolts_requests_total counter']
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                lines.append(f'thinkbolts_requests_total{{endpoint="{label(endpoint)}",method="{method}",status="{status}"}} {count}')
+
+            lines += ['# HELP thinkbolts_request_duration_seconds Wall time per request.',
+                      '# TYPE thinkbolts_request_duration_seconds histogram']
+            for endpoint, buckets in sorted(self.duration_buckets.items()):
+                name = label(endpoint)
+                for bound, count in zip(self.BUCKETS, buckets):
+                    lines.append(f'thinkbolts_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} {count}')
+                lines.append(f'thinkbolts_request_duration_seconds_bucket{{endpoint="{name}",le="+Inf"}} {self.duration_count[endpoint]}')
+                lines.append(f'thinkbolts_request_duration_seconds_sum{{endpoint="{name}"}} {self.duration_sum[endpoint]:.6f}')
+                lines.append(f'thinkbolts_request_duration_seconds_count{{endpoint="{name}"}} {self.duration_count[endpoint]}')
+
+            lines += ['# HELP thinkbolts_sql_statements_total SQL statements executed while handling requests.',
+                      '# TYPE thinkbolts_sql_statements_total counter']
+            for endpoint, count in sorted(self.sql_statements.items()):
+                lines.append(f'thinkbolts_sql_statements_total{{endpoint="{label(endpoint)}"}} {count}')
+
+            lines += ['# HELP thinkbolts_db_seconds_total Time spent executing SQL while handling requests.',
+                      '# TYPE thinkbolts_db_seconds_total counter']
+            for endpoint, seconds in sorted(self.db_seconds.items()):
+                lines.append(f'thinkbolts_db_seconds_total{{endpoint="{label(endpoint)}"}} {seconds:.6f}')
+
+            lines += ['# HELP thinkbolts_recommendation_stage_seconds Time spent in each recommendation stage.',
+                      '# TYPE thinkbolts_recommendation_stage_seconds summary']
+            for stage, seconds in sorted(self.stage_seconds.items()):
+                lines.append(f'thinkbolts_recommendation_stage_seconds_sum{{stage="{stage}"}} {seconds:.6f}')
+                lines.append(f'thinkbolts_recommendation_stage_seconds_count{{stage="{stage}"}} {self.stage_count[stage]}')
+        return '\n'.join(lines) + '\n'
+
+
+
+@contextmanager
+def timed(stage):
+    """Times a block of the recommendation pipeline, per request and in the app's metrics."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if has_app_context():
+            current_app.extensions['request_metrics'].observe_stage(stage, elapsed)
+        if has_request_context() and 'stage_seconds' in g:
+            g.stage_seconds[stage] += elapsed
+
+
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    g.sql_statements = 0
+    g.db_seconds = 0.0
+    g.stage_seconds = defaultdict(float)
+    # Statements are only kept when the slow-request log is switched on
+    g.sql_log = [] if current_app.config['SLOW_REQUEST_LOG_MS'] is not None else None
+
+
+def record_request_metrics(response):
+    if 'request_started' not in g or request.endpoint == 'main.metrics':
+        return response
+
+    elapsed = time.perf_counter() - g.request_started
+    endpoint = request.endpoint or 'unknown'
+    current_app.extensions['request_metrics'].observe_request(endpoint, request.method, response.status_code,
+                                    elapsed, g.sql_statements, g.db_seconds)
+
+    threshold = current_app.config['SLOW_REQUEST_LOG_MS']
+    if threshold is not None and elapsed * 1000 >= threshold:
+        stages = ', '.join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in g.stage_seconds.items())
+        statements = '\n'.join(f"  {seconds * 1000:8.2f}ms  {statement}" for statement, seconds in g.sql_log)
+        current_app.logger.warning(
+            "Slow request %s %s: %.1fms, %d SQL statements (%.1fms in DB)%s\n%s",
+            request.method, request.full_path.rstrip('?'), elapsed * 1000, g.sql_statements, g.db_seconds * 1000,
+            f", {stages}" if stages else '', statements
+        )
+    return response
+
+
+def init_app(app):
+    app.extensions['request_metrics'] = RequestMetrics()
+    app.before_request(start_request_timer)
+    app.after_request(record_request_metrics)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def record_statement(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['statement_started'].pop()
+    if has_request_context() and 'sql_statements' in g:
+        g.sql_statements += 1
+        g.db_seconds += elapsed
+        if g.sql_log is not None:
+            g.sql_log.append((' '.join(statement.split()), elapsed))
@@ -0,0 +1,180 @@
+"""
+Login storm benchmark: fires a burst of logins at the app while other pages keep being requested,
+once with passwords hashed on the request threads and once through the bounded password pool.
+
+Requests are served by --slots threads, like the request threads of the gunicorn workers; a
+probe's latency counts the time it waited for a free thread. A login shed with a 503 is sent
+again after its Retry-After, as a browser user would. Reports login throughput, how many 503s
+were sent and p50/p95/p99 latency of the probe routes with and without the burst.
+
+    python login_benchmark.py --logins 300 --slots 8 --output logins.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+parser = argparse.ArgumentParser(description="Measure login throughput and other routes' latency during a login burst.")
+parser.add_argument('--accounts', type=int, default=500, help="student accounts seeded")
+parser.add_argument('--logins', type=int, default=300, help="logins in the burst, all sent at once")
+parser.add_argument('--slots', type=int, default=8, help="threads serving requests")
+parser.add_argument('--max-attempts', type=int, default=20, help="times a shed login is retried before giving up")
+parser.add_argument('--probes', type=int, default=200, help="requests to other routes measured per run")
+parser.add_argument('--probe-interval-ms', type=float, default=20, help="time between two probe requests")
+parser.add_argument('--hash-workers', type=int, default=2, help="PASSWORD_HASH_WORKERS of the pooled run")
+parser.add_argument('--hash-queue', type=int, default=4, help="PASSWORD_HASH_QUEUE of the pooled run")
+parser.add_argument('--hash-method', default='scrypt', help="PASSWORD_HASH_METHOD, e.g. scrypt or pbkdf2:sha256:600000")
+parser.add_argument('--output', default=None, help="also write the JSON report to this file")
+args = parser.parse_args()
+
+# create_app() reads DATABASE_URL; point it at SQLite
+database_path = os.path.join(tempfile.mkdtemp(prefix='thinkbolts-logins-'), 'logins.db')
+os.environ['DATABASE_URL'] = f"sqlite:///{database_path}"
+
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db, Student, Company, JobPosting, BPUT_COLLEGES, INDIAN_IT_CITIES
+from bench_utils import percentile
+
+PROBE_URLS = ['/', '/api/jobs', '/api/jobs?location=Pune']
+
+
+def seed_database():
+    db.drop_all()
+    db.create_all()
+    # Every account shares one password, hashed once
+    password_hash = generate_password_hash('pass1234', method=args.hash_method)
+    db.session.bulk_insert_mappings(Student, [{
+        'full_name': f"Student {i}",
+        'email': f"student{i}@bench.in",
+        'college': BPUT_COLLEGES[i % len(BPUT_COLLEGES)],
+        'registration_number': f"B{i:08d}",
+        'password_hash': password_hash,
+        'skills': [],
+    } for i in range(args.accounts)])
+    db.session.add(Company(company_name='Bench', email='bench@bench.in', password_hash=password_hash))
+    db.session.flush()
+    db.session.bulk_insert_mappings(JobPosting, [{
+        'company_id': 1,
+        'job_role': f"Role {i}",
+        'required_skills': ['python', 'sql'],
+        'location': INDIAN_IT_CITIES[i % len(INDIAN_IT_CITIES)],
+        'cgpa_required': 6.0,
+        'description': 'Benchmark posting',
+    } for i in range(500)])
+    db.session.commit()
+
+
+def latency_summary(latencies):
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+    }
+
+
+def run(test_app, burst):
+    """Sends the probes (and, with `burst`, the logins) through --slots threads."""
+    local = threading.local()
+
+    def client(logged_in):
+        """One test client per thread and kind; probes are sent as an already logged-in student."""
+        key = 'probe_client' if logged_in else 'login_client'
+        if not hasattr(local, key):
+            setattr(local, key, test_app.test_client())
+            if logged_in:
+                with getattr(local, key).session_transaction() as sess:
+                    sess.update({'logged_in': True, 'role': 'student', 'user_id': 1})
+        return getattr(local, key)
+
+    def login(i):
+        response = client(False).post('/student_login', data={'email': f"student{i % args.accounts}@bench.in",
+                                                         'password': 'pass1234'})
+        return response.status_code, int(response.headers.get('Retry-After', 0))
+
+    def login_until_done(i, submitted):
+        """One user: logs in, retrying after Retry-After while the app sheds; returns (status, attempts, seconds)."""
+        for attempt in range(1, args.max_attempts + 1):
+            status, retry_after = slots.submit(login, i).result()
+            if status != 503:
+                break
+            time.sleep(retry_after)
+        return status, attempt, time.perf_counter() - submitted
+
+    def probe(url, submitted):
+        client(True).get(url)
+        return (time.perf_counter() - submitted) * 1000
+
+    users = ThreadPoolExecutor(max_workers=max(args.logins, 1))
+    with ThreadPoolExecutor(max_workers=args.slots) as slots:
+        started = time.perf_counter()
+        logins = [users.submit(login_until_done, i, started) for i in range(args.logins if burst else 0)]
+        probes = []
+        for i in range(args.probes):
+            probes.append(slots.submit(probe, PROBE_URLS[i % len(PROBE_URLS)], time.perf_counter()))
+            time.sleep(args.probe_interval_ms / 1000)
+        login_results = [future.result() for future in logins]
+        burst_seconds = max((elapsed for _, _, elapsed in login_results), default=0)
+        result = {'probes': latency_summary([future.result() for future in probes])}
+
+    users.shutdown()
+
+    if burst:
+        accepted = sum(1 for status, _, _ in login_results if status == 302)
+        result['logins'] = {
+            'users': len(login_results),
+            'succeeded': accepted,
+            'gave_up': sum(1 for status, _, _ in login_results if status == 503),
+            'responses_503': sum(attempts - 1 for _, attempts, _ in login_results)
+            + sum(1 for status, _, _ in login_results if status == 503),
+            'median_login_seconds': round(sorted(elapsed for _, _, elapsed in login_results)[len(login_results) // 2], 2),
+            'burst_seconds': round(burst_seconds, 2),
+            'logins_per_second': round(accepted / burst_seconds, 1) if burst_seconds else 0,
+        }
+    result['wall_seconds'] = round(time.perf_counter() - started, 2)
+    return result
+
+
+def main():
+    report = {
+        'config': {key: value for key, value in vars(args).items() if key != 'output'},
+        'environment': {'python': sys.version.split()[0], 'platform': platform.platform(), 'cpus': os.cpu_count()},
+        'results': {},
+    }
+    with create_app().app_context():
+        seed_database()
+
+    modes = [
+        ('inline (request thread)', {'PASSWORD_HASH_WORKERS': 0}),
+        (f"pool ({args.hash_workers} workers, queue {args.hash_queue})",
+         {'PASSWORD_HASH_WORKERS': args.hash_workers, 'PASSWORD_HASH_QUEUE': args.hash_queue}),
+    ]
+    for name, config in modes:
+        test_app = create_app({'PASSWORD_HASH_METHOD': args.hash_method, **config})
+        results = report['results'][name] = {'idle': run(test_app, burst=False), 'login burst': run(test_app, burst=True)}
+        test_app.extensions['password_hasher'].shutdown()
+
+        logins = results['login burst']['logins']
+        for phase in ('idle', 'login burst'):
+            probes = results[phase]['probes']
+            print(f"{name:32s} {phase:12s} probes p50 {probes['p50_ms']:8.2f}ms  p95 {probes['p95_ms']:8.2f}ms  "
+                  f"p99 {probes['p99_ms']:8.2f}ms", file=sys.stderr)
+        print(f"{name:32s} {'':12s} logins {logins['succeeded']}/{logins['users']} ok, {logins['responses_503']} 503s, "
+              f"{logins['logins_per_second']}/s, median user waited {logins['median_login_seconds']}s", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import json
+import time
+
+from sqlalchemy import text
+
+# This import will work correctly when you run it from your local machine
+from app import create_app, db
+
+# (table, column, nullable) of every skills column stored as a JSON list
+SKILLS_COLUMNS = [
+    ('student', 'skills', True),
+    ('job_posting', 'required_skills', False),
+]
+
+
+def parse_legacy_skills(value):
+    """
+    Turns whatever an old row holds into a list of skill names: a JSON list,
+    a JSON-encoded string, a plain comma-separated string, or nothing.
+    """
+    if value is None:
+        return []
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    try:
+        parsed = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        parsed = value
+    if isinstance(parsed, str):
+        parsed = parsed.split(',')
+    if not isinstance(parsed, list):
+        return []
+    return [str(skill).strip() for skill in parsed if skill is not None and str(skill).strip()]
+
+
+def migrate_column(table, column, batch_size, dry_run=False):
+    """Rewrites the rows of one column in id order, `batch_size` rows per transaction."""
+    select = text(f"SELECT id, {column} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit")
+    update = text(f"UPDATE {table} SET {column} = :value WHERE id = :id")
+
+    last_id = scanned = changed = 0
+    started = time.perf_counter()
+    while True:
+        rows = db.session.execute(select, {'last_id': last_id, 'limit': batch_size}).all()
+        if not rows:
+            break
+        updates = []
+        for row_id, value in rows:
+            normalized = json.dumps(parse_legacy_skills(value))
+            if value != normalized:
+                updates.append({'id': row_id, 'value': normalized})
+        if updates and not dry_run:
+            db.session.execute(update, updates)
+        db.session.commit()
+
+        last_id = rows[-1][0]
+        scanned += len(rows)
+        changed += len(updates)
+        elapsed = time.perf_counter() - started
+        print(f"{table}.{column}: {scanned} rows scanned, {changed} rewritten ({scanned / elapsed:.0f} rows/sec)...")
+    return scanned, changed
+
+
+def convert_to_json_type(table, column, nullable):
+    """On MySQL, changes the column from TEXT to the native JSON type (a no-op if it already is)."""
+    data_type = db.session.execute(text(
+        "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = :column"
+    ), {'table': table, 'column': column}).scalar()
+    if data_type == 'json':
+        return False
+    db.session.execute(text(f"ALTER TABLE {table} MODIFY {column} JSON {'NULL' if nullable else 'NOT NULL'}"))
+    db.session.commit()
+    return True
+
+
+def migrate_skills(batch_size=1000, dry_run=False):
+    """
+    Normalises every skills value to a JSON list, then switches MySQL columns to the
+    JSON type. SQLite keeps JSON as text, so only the rows are rewritten there.
+    """
+    app = create_app()
+    with app.app_context():
+        for table, column, nullable in SKILLS_COLUMNS:
+            scanned, changed = migrate_column(table, column, batch_size, dry_run)
+            print(f"{table}.{column}: {changed} of {scanned} rows {'would be ' if dry_run else ''}rewritten.")
+            if db.engine.dialect.name == 'mysql' and not dry_run:
+                if convert_to_json_type(table, column, nullable):
+                    print(f"{table}.{column}: column converted to JSON.")
+        print("\nSkills migration finished! ✅")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert the skills columns to JSON lists.")
+    parser.add_argument('--batch-size', type=int, default=1000, help="rows rewritten per transaction")
+    parser.add_argument('--dry-run', action='store_true', help="only report how many rows would change")
+    args = parser.parse_args()
+    migrate_skills(batch_size=args.batch_size, dry_run=args.dry_run)
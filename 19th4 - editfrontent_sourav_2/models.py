@@ -0,0 +1,206 @@
+"""
+Database handle and models. `db` is bound to an application by create_app() in app.py,
+so scripts can import the models without building the web app or the recommender.
+"""
+from datetime import datetime
+
+from flask import g, has_request_context
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as FlaskSQLAlchemySession
+from sqlalchemy import DDL, event
+
+# ============ DATABASE CONNECTIONS ============
+
+class RoutingSession(FlaskSQLAlchemySession):
+    """
+    Sends the reads of @read_only requests to the 'replica' bind. Flushes, INSERT/UPDATE/DELETE
+    statements and everything outside a read-only request go to the primary.
+    """
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            writing = self._flushing or getattr(clause, 'is_dml', False)
+            if has_request_context():
+                if writing:
+                    g.db_wrote = True
+                elif g.get('read_only') and 'replica' in self._db.engines:
+                    return self._db.engines['replica']
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# ============ DATABASE MODELS ============
+# Inverted skill index: which students / jobs have which normalised skill
+student_skill = db.Table('student_skill',
+    db.Column('student_id', db.Integer, db.ForeignKey('student.id'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skill.id'), primary_key=True),
+    db.Index('ix_student_skill_skill_id', 'skill_id', 'student_id')
+)
+
+job_skill = db.Table('job_skill',
+    db.Column('job_id', db.Integer, db.ForeignKey('job_posting.id'), primary_key=True),
+    db.Column('skill_id', db.Integer, db.ForeignKey('skill.id'), primary_key=True),
+    db.Index('ix_job_skill_skill_id', 'skill_id', 'job_id')
+)
+
+class Skill(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False) # Lower-cased, see normalize_skill()
+
+class Student(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    full_name = db.Column(db.String(120), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    mobile = db.Column(db.String(10), nullable=True)
+    # Existing databases: CREATE INDEX ix_student_college ON student (college)
+    college = db.Column(db.String(200), nullable=False, index=True)
+    registration_number = db.Column(db.String(10), unique=True, nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    cgpa = db.Column(db.Float, default=0.0)
+    profile_photo = db.Column(db.String(100))
+    skills = db.Column(db.JSON(none_as_null=True)) # List of skill names, decoded once when the row is loaded
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    projects = db.relationship('StudentProject', backref='student', lazy=True, cascade='all, delete-orphan')
+    applications = db.relationship('JobApplication', backref='student', lazy=True, cascade='all, delete-orphan')
+    recommendations = db.relationship('StudentRecommendation', backref='student', lazy=True, cascade='all, delete-orphan')
+    indexed_skills = db.relationship('Skill', secondary=student_skill, lazy=True)
+
+class StudentProject(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False)
+    project_title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    github_link = db.Column(db.String(500))
+    site_link = db.Column(db.String(500))
+    youtube_link = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Company(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    company_name = db.Column(db.String(200), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    logo = db.Column(db.String(100))
+    description = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    job_postings = db.relationship('JobPosting', backref='company', lazy=True, cascade='all, delete-orphan')
+
+class JobPosting(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('company.id'), nullable=False)
+    job_role = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text)
+    required_skills = db.Column(db.JSON, nullable=False) # List of skill names
+    cgpa_required = db.Column(db.Float, nullable=False)
+    location = db.Column(db.String(100), nullable=False) # --- NEW ---
+    salary_min = db.Column(db.Float)
+    salary_max = db.Column(db.Float)
+    contact_email = db.Column(db.String(120))
+    contact_mobile = db.Column(db.String(10))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Keyset pagination walks (created_at, id), optionally within one location
+    __table_args__ = (
+        db.Index('ix_job_posting_location_created_at', 'location', 'created_at', 'id'),
+        db.Index('ix_job_posting_created_at', 'created_at', 'id'),
+        # A company's postings, newest first. Existing databases:
+        # CREATE INDEX ix_job_posting_company_id_created_at ON job_posting (company_id, created_at)
+        db.Index('ix_job_posting_company_id_created_at', 'company_id', 'created_at'),
+    )
+    applications = db.relationship('JobApplication', backref='job_posting', lazy=True, cascade='all, delete-orphan')
+    recommendations = db.relationship('StudentRecommendation', backref='job_posting', lazy=True, cascade='all, delete-orphan')
+    embeddings = db.relationship('JobEmbedding', lazy=True, cascade='all, delete-orphan')
+    indexed_skills = db.relationship('Skill', secondary=job_skill, lazy=True)
+
+class JobApplication(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    status = db.Column(db.String(20), default='Applied')
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # One application per student and job. Existing databases need their duplicates removed first:
+    # ALTER TABLE job_application ADD CONSTRAINT uq_job_application_student_job UNIQUE (student_id, job_id)
+    __table_args__ = (
+        db.UniqueConstraint('student_id', 'job_id', name='uq_job_application_student_job'),
+        # Applicant counts and lists per posting. Existing databases:
+        # CREATE INDEX ix_job_application_job_id ON job_application (job_id, applied_at)
+        db.Index('ix_job_application_job_id', 'job_id', 'applied_at'),
+    )
+
+class StudentRecommendation(db.Model):
+    # Top-N recommendations written by precompute_recommendations.py
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student.id'), nullable=False, index=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    score = db.Column(db.Float, nullable=False)
+    rank = db.Column(db.Integer, nullable=False)
+    generated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class JobEmbedding(db.Model):
+    # Job vectors of the embedding matchers (float32 bytes), one row per job and backend
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), primary_key=True)
+    backend = db.Column(db.String(120), primary_key=True) # EmbeddingMatcher.storage_key
+    vector = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class CollegeStats(db.Model):
+    # Per-college counters for the university dashboard (see USE_COLLEGE_STATS_TABLE)
+    college = db.Column(db.String(200), primary_key=True)
+    total_students = db.Column(db.Integer, nullable=False, default=0)
+    placed_students = db.Column(db.Integer, nullable=False, default=0)
+
+class SearchDocument(db.Model):
+    # Text indexed by the full-text search: one row per job posting (kind 'job': role, then
+    # description and skills) and per student (kind 'student': skills, then project titles and
+    # descriptions). Searched through FTS5 on SQLite and the FULLTEXT index on MySQL
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(10), nullable=False)
+    object_id = db.Column(db.Integer, nullable=False)
+    title = db.Column(db.String(500), nullable=False, default='')
+    body = db.Column(db.Text, nullable=False, default='')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    __table_args__ = (
+        db.UniqueConstraint('kind', 'object_id', name='uq_search_document_kind_object'),
+        db.Index('ix_search_document_fulltext', 'title', 'body', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
+
+# SQLite: an external-content FTS5 table over search_document, kept in sync by triggers.
+# kind / object_id are stored unindexed so a match needs no join; prefix='2 3' makes "pyt*" cheap
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+        kind UNINDEXED, object_id UNINDEXED, title, body,
+        content='search_document', content_rowid='id', prefix='2 3', tokenize='unicode61 remove_diacritics 2')""",
+    """CREATE TRIGGER IF NOT EXISTS search_document_ai AFTER INSERT ON search_document BEGIN
+        INSERT INTO search_fts(rowid, kind, object_id, title, body)
+        VALUES (new.id, new.kind, new.object_id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_document_ad AFTER DELETE ON search_document BEGIN
+        INSERT INTO search_fts(search_fts, rowid, kind, object_id, title, body)
+        VALUES ('delete', old.id, old.kind, old.object_id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS search_document_au AFTER UPDATE ON search_document BEGIN
+        INSERT INTO search_fts(search_fts, rowid, kind, object_id, title, body)
+        VALUES ('delete', old.id, old.kind, old.object_id, old.title, old.body);
+        INSERT INTO search_fts(rowid, kind, object_id, title, body)
+        VALUES (new.id, new.kind, new.object_id, new.title, new.body);
+    END""",
+]
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(SearchDocument.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(SearchDocument.__table__, 'before_drop',
+             DDL('DROP TABLE IF EXISTS search_fts').execute_if(dialect='sqlite'))
+
+class UniversityUser(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    role = db.Column(db.String(50), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class CollegeUser(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    college_name = db.Column(db.String(200), nullable=False)
+    username = db.Column(db.String(120), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    role = db.Column(db.String(50), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,112 @@
+"""
+Password hashing off the request thread. Hashes are computed in a small process pool so a
+burst of logins cannot take every CPU from the other routes; once PASSWORD_HASH_WORKERS +
+PASSWORD_HASH_QUEUE hashes are in flight, further logins fail fast with PasswordHasherBusy
+(a 503 with Retry-After) instead of queueing behind them.
+
+Kept apart from app.py so the pool's worker processes only import werkzeug.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+
+# forkserver where the platform has it (Linux, macOS), spawn elsewhere (Windows)
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hash pool is full; the request should be retried later."""
+
+
+def method_prefix(method):
+    """The 'method:params' prefix werkzeug stores for `method`, with its default parameters filled in."""
+    name, *params = method.split(':')
+    if name == 'scrypt':
+        defaults = ['32768', '8', '1']  # n, r, p
+    elif name == 'pbkdf2':
+        defaults = ['sha256', str(DEFAULT_PBKDF2_ITERATIONS)]
+    else:
+        return method
+    return ':'.join([name] + params + defaults[len(params):])
+
+
+class PasswordHasher:
+    """
+    generate / check_password_hash through a bounded process pool, one per app in each worker
+    process (app.extensions['password_hasher']), started on first use. PASSWORD_HASH_WORKERS = 0 hashes on the calling thread (CLI scripts).
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._slots = None
+        self.workers = 0
+        self.method = 'scrypt'
+        self._prefix = method_prefix(self.method)
+        self.in_flight = 0
+        self.rejected = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.workers = app.config['PASSWORD_HASH_WORKERS']
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self._prefix = method_prefix(self.method)
+        self._slots = threading.BoundedSemaphore(self.workers + app.config['PASSWORD_HASH_QUEUE'])
+        app.extensions['password_hasher'] = self
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # Not fork: the web worker already runs request and image threads, and a forked
+                # child could inherit a lock one of them held. The forkserver starts workers from a
+                # clean single-threaded process, which then only import this module.
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context(START_METHOD))
+            return self._pool
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return self._get_pool().submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool for the next login
+            with self._lock:
+                self._pool = None
+            raise PasswordHasherBusy()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True if `password_hash` was made with other settings than PASSWORD_HASH_METHOD."""
+        return password_hash.split('$', 1)[0] != self._prefix
+
+    def stats(self):
+        with self._lock:
+            return {'in_flight': self.in_flight, 'rejected': self.rejected}
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
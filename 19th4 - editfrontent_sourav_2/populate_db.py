@@ -1,8 +1,10 @@
+import argparse
+import time
 import pandas as pd
 # This import will work correctly when you run it from your local machine
-from app import app, db, Student, Company, JobPosting, StudentProject ,INDIAN_IT_CITIES
+from app import create_app, db, Company, JobPosting, Skill, job_skill, INDIAN_IT_CITIES, normalize_skill, \
+    rebuild_search_index
 from werkzeug.security import generate_password_hash
-import json
 import random
 
 # List of BPUT colleges to assign to students
@@ -17,68 +19,105 @@ BPUT_COLLEGES = [
     "Orissa Engineering College, Bhubaneswar (OEC)",
 ]
 
-def create_dummy_data():
+def parse_skills(value):
+    """Splits the CSV 'skills' cell into a list; empty cells become []."""
+    if not isinstance(value, str):
+        return []
+    return [s.strip() for s in value.split(',') if s.strip()]
+
+def insert_companies(names, companies_cache, password_hash):
+    """Bulk-inserts the companies not seen yet and records their ids in companies_cache."""
+    new_names = [name for name in dict.fromkeys(names) if name not in companies_cache]
+    if not new_names:
+        return 0
+    db.session.bulk_insert_mappings(Company, [{
+        'company_name': name,
+        'email': f"{name.lower().replace(' ', '').replace('.', '')}@in.com",
+        'password_hash': password_hash,
+    } for name in new_names])
+    companies_cache.update(
+        db.session.query(Company.company_name, Company.id).filter(Company.company_name.in_(new_names)).all()
+    )
+    return len(new_names)
+
+def index_job_skills(after_job_id, skills_cache):
+    """Adds the job_skill rows of every job inserted after `after_job_id`."""
+    jobs = db.session.query(JobPosting.id, JobPosting.required_skills).filter(JobPosting.id > after_job_id).all()
+    job_skills = {job_id: {normalize_skill(s) for s in skills or []} for job_id, skills in jobs}
+
+    new_names = {name for names in job_skills.values() for name in names} - skills_cache.keys()
+    if new_names:
+        db.session.bulk_insert_mappings(Skill, [{'name': name} for name in new_names])
+        skills_cache.update(db.session.query(Skill.name, Skill.id).filter(Skill.name.in_(new_names)).all())
+
+    rows = [{'job_id': job_id, 'skill_id': skills_cache[name]} for job_id, names in job_skills.items() for name in names]
+    if rows:
+        db.session.execute(job_skill.insert(), rows)
+
+def create_dummy_data(csv_path='internship_posted_data.csv', chunk_size=1000, append=False):
     """
-    Wipes the database and populates it with jobs from the CSV 
-    and a set of 50 dummy students.
+    Loads companies and job postings from the CSV in chunks of `chunk_size` rows.
+    Each chunk is inserted with executemany and committed as one transaction.
+    Without `append` the database is wiped first.
     """
+    app = create_app()
     with app.app_context():
-        print("Dropping all tables from the database...")
-        db.drop_all()
+        if not append:
+            print("Dropping all tables from the database...")
+            db.drop_all()
         print("Creating new tables...")
         db.create_all()
 
-        
         try:
-            df = pd.read_csv('internship_posted_data.csv')
-            print(f"Successfully loaded {len(df)} jobs from CSV.")
+            # Stream the CSV instead of loading it all into memory
+            reader = pd.read_csv(csv_path, chunksize=chunk_size)
         except FileNotFoundError:
-            print("ERROR: 'job_postings22 - Copy.csv' not found. Please make sure it's in the same directory.")
+            print(f"ERROR: '{csv_path}' not found. Please make sure it's in the same directory.")
             return
 
-        # --- Create Companies and Job Postings ---
-        all_skills = set()
-        companies_cache = {} # To avoid querying the DB repeatedly
-
-        for index, row in df.iterrows():
-            company_name = row['company']
-            
-            if company_name not in companies_cache:
-                company = Company(
-                    company_name=company_name,
-                    email=f"{company_name.lower().replace(' ', '').replace('.', '')}@in.com",
-                    password_hash=generate_password_hash('pass1234')
-                )
-                db.session.add(company)
-                db.session.commit() # Commit to get the ID
-                companies_cache[company_name] = company.id
-            
-            company_id = companies_cache[company_name]
-            
-            # Create Job Posting
-            try:
-                skills_list = [s.strip() for s in row['skills'].split(',')]
-                all_skills.update(skills_list)
-            except AttributeError:
-                skills_list = [] 
-
-            job = JobPosting(
-                company_id=company_id,
-                job_role=row['role'],
-                required_skills=json.dumps(skills_list),
-                location=random.choice(INDIAN_IT_CITIES),
-                cgpa_required=float(row['cgpa_minimum']),
-                description=f"Seeking a talented {row['role']} to join our team. Key skills include {row['skills']}."
-            )
-            db.session.add(job)
-
-        print("Finished processing companies and job postings.")
-
-        
-
-        # Commit all students and jobs
-        db.session.commit()
+        # Every dummy company shares the same password, so hash it only once
+        password_hash = generate_password_hash('pass1234')
+        companies_cache = dict(db.session.query(Company.company_name, Company.id).all())
+        skills_cache = dict(db.session.query(Skill.name, Skill.id).all())
+
+        started = time.perf_counter()
+        total_rows = total_companies = 0
+        for df in reader:
+            # Older exports call the column cgpa_required instead of cgpa_minimum
+            cgpa_column = 'cgpa_minimum' if 'cgpa_minimum' in df.columns else 'cgpa_required'
+            df = df.dropna(subset=['company', 'role'])
+
+            # --- Create Companies and Job Postings ---
+            total_companies += insert_companies(df['company'].tolist(), companies_cache, password_hash)
+
+            last_job_id = db.session.query(db.func.max(JobPosting.id)).scalar() or 0
+            db.session.bulk_insert_mappings(JobPosting, [{
+                'company_id': companies_cache[row.company],
+                'job_role': row.role,
+                'required_skills': parse_skills(row.skills),
+                'location': random.choice(INDIAN_IT_CITIES),
+                'cgpa_required': float(getattr(row, cgpa_column)),
+                'description': f"Seeking a talented {row.role} to join our team. Key skills include {row.skills}.",
+            } for row in df.itertuples(index=False)])
+            index_job_skills(last_job_id, skills_cache)
+            db.session.commit()
+
+            total_rows += len(df)
+            elapsed = time.perf_counter() - started
+            print(f"Loaded {total_rows} jobs ({total_rows / elapsed:.0f} rows/sec)...")
+
+        print("Rebuilding the search index...")
+        rebuild_search_index(chunk_size)
+
+        elapsed = time.perf_counter() - started
+        print(f"Finished processing {total_companies} new companies and {total_rows} job postings "
+              f"in {elapsed:.2f}s ({total_rows / elapsed if elapsed else 0:.0f} rows/sec).")
         print("\nDatabase has been successfully populated with dummy data! ✅")
 
 if __name__ == '__main__':
-    create_dummy_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Load companies and job postings from a CSV.")
+    parser.add_argument('--csv', default='internship_posted_data.csv', help="CSV with company, role, skills and cgpa columns")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="rows inserted per transaction")
+    parser.add_argument('--append', action='store_true', help="keep existing data instead of dropping all tables")
+    args = parser.parse_args()
+    create_dummy_data(csv_path=args.csv, chunk_size=args.chunk_size, append=args.append)
@@ -0,0 +1,126 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy.orm import selectinload
+
+# This import will work correctly when you run it from your local machine
+from app import create_app, db, Student, StudentRecommendation
+from recommender import make_matcher, student_document, hybrid_scores, top_k, similarity
+
+# Job index handed to every worker process once, instead of once per chunk
+_worker_index = {}
+
+
+def _init_worker(encoder, matrix, job_ids, cgpa_required, min_score):
+    _worker_index.update(encoder=encoder, matrix=matrix, job_ids=job_ids,
+                         cgpa_required=cgpa_required, min_score=min_score)
+
+
+def score_chunk(chunk, top_n):
+    """
+    Scores one chunk of students against every job with a single matrix multiply.
+    `chunk` is a list of (student_id, cgpa, document, applied_job_ids) tuples.
+    Returns a list of (student_id, [(job_id, score), ...]) with the top N jobs per student.
+    """
+    encoder = _worker_index['encoder']
+    job_ids = _worker_index['job_ids']
+    cgpa_required = _worker_index['cgpa_required']
+
+    student_matrix = encoder.transform([document for _, _, document, _ in chunk])
+    # (students x features) . (features x jobs); rows are L2-normalised so this is the cosine similarity
+    scores_by_student = similarity(student_matrix, _worker_index['matrix'])
+
+    results = []
+    for row, (student_id, cgpa, _, applied_job_ids) in enumerate(chunk):
+        scores = hybrid_scores(scores_by_student[row], cgpa, cgpa_required)
+        best = top_k(scores, top_n, min_score=_worker_index['min_score'],
+                     exclude=np.isin(job_ids, applied_job_ids))
+        results.append((student_id, [(int(job_ids[i]), round(float(scores[i]), 2)) for i in best]))
+    return results
+
+
+def iter_student_chunks(chunk_size):
+    """Yields students in id order as chunks of plain tuples that can be sent to a worker."""
+    last_id = 0
+    while True:
+        students = Student.query.options(
+            selectinload(Student.projects), selectinload(Student.applications)
+        ).filter(Student.id > last_id).order_by(Student.id).limit(chunk_size).all()
+        if not students:
+            return
+        yield [(s.id, s.cgpa, student_document(s), [a.job_id for a in s.applications]) for s in students]
+        last_id = students[-1].id
+        db.session.expunge_all()
+
+
+def save_chunk(results, generated_at):
+    student_ids = [student_id for student_id, _ in results]
+    StudentRecommendation.query.filter(StudentRecommendation.student_id.in_(student_ids)).delete(synchronize_session=False)
+    db.session.bulk_insert_mappings(StudentRecommendation, [
+        {'student_id': student_id, 'job_id': job_id, 'score': score, 'rank': rank, 'generated_at': generated_at}
+        for student_id, recommendations in results
+        for rank, (job_id, score) in enumerate(recommendations, start=1)
+    ])
+    db.session.commit()
+
+
+def precompute_recommendations(top_n=20, chunk_size=200, workers=None):
+    """
+    Computes the top N recommendations of every student and stores them in the
+    student_recommendation table, stamped with one generation timestamp.
+    Chunks of students are scored in a process pool; `workers=1` runs in-process.
+    """
+    workers = workers or os.cpu_count() or 1
+    app = create_app()
+    with app.app_context():
+        db.create_all()  # Creates the student_recommendation table on first run
+        job_index = make_matcher(app.config)
+        print(f"Building the {job_index.name} job index...")
+        job_index.rebuild()
+        if not len(job_index.job_ids):
+            print("No job postings to recommend, nothing to do.")
+            return
+
+        init_args = (job_index.encoder, job_index.matrix, job_index.job_ids,
+                     job_index.cgpa_required, app.config['RECOMMENDATION_MIN_SCORE'])
+        generated_at = datetime.utcnow()
+        started = time.perf_counter()
+        total = 0
+
+        if workers == 1:
+            _init_worker(*init_args)
+            for chunk in iter_student_chunks(chunk_size):
+                save_chunk(score_chunk(chunk, top_n), generated_at)
+                total += len(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+                pending = []
+                for chunk in iter_student_chunks(chunk_size):
+                    pending.append(pool.submit(score_chunk, chunk, top_n))
+                    # Keep a bounded number of chunks in flight so memory stays flat
+                    if len(pending) >= workers * 2:
+                        results = pending.pop(0).result()
+                        save_chunk(results, generated_at)
+                        total += len(results)
+                for future in pending:
+                    results = future.result()
+                    save_chunk(results, generated_at)
+                    total += len(results)
+
+        elapsed = time.perf_counter() - started
+        print(f"Precomputed top {top_n} recommendations for {total} students against "
+              f"{len(job_index.job_ids)} jobs in {elapsed:.2f}s "
+              f"({total / elapsed if elapsed else 0:.1f} students/sec, {workers} worker(s)).")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Precompute job recommendations for every student.")
+    parser.add_argument('--top-n', type=int, default=20, help="recommendations stored per student")
+    parser.add_argument('--chunk-size', type=int, default=200, help="students scored per matrix multiply")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+    precompute_recommendations(top_n=args.top_n, chunk_size=args.chunk_size, workers=args.workers)
@@ -0,0 +1,21 @@
+import argparse
+import time
+
+# This import will work correctly when you run it from your local machine
+from app import create_app, db, rebuild_college_stats
+
+
+def main():
+    """Fills the college_stats summary table used when USE_COLLEGE_STATS_TABLE is on."""
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        rebuild_college_stats()
+        print(f"Rebuilt college_stats in {time.perf_counter() - started:.2f}s.")
+        print("\nCollege stats rebuilt! ✅")
+
+
+if __name__ == '__main__':
+    argparse.ArgumentParser(description="Recompute the per-college counters of the university dashboard.").parse_args()
+    main()
@@ -0,0 +1,631 @@
+"""
+Recommendation engine: turns students and job postings into vectors, ranks jobs for a
+student and, the other way round, candidate students for a job posting.
+
+Importing this module loads numpy, scipy and scikit-learn, so app.py only imports it
+on the first recommendation (see get_job_index()); pages that never recommend anything,
+CLI scripts and freshly forked workers start without the ML stack.
+"""
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from sklearn.random_projection import SparseRandomProjection
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from instrumentation import timed
+from models import db, Student, StudentProject, JobPosting, JobEmbedding
+
+def student_document(student):
+    """Builds the TF-IDF "document" for a student (skills + project descriptions)."""
+    student_skills = ' '.join(student.skills or [])
+    student_projects = ' '.join([p.description for p in student.projects if p.description])
+    return f"{student_skills} {student_projects}"
+
+def job_document(job):
+    """Builds the TF-IDF "document" for a job posting (role + description + skills)."""
+    skills = ' '.join(job.required_skills or [])
+    return f"{job.job_role} {job.description} {skills}"
+
+
+def similarity(queries, matrix):
+    """Dot products of L2-normalised query rows with every row of `matrix`, as a dense array."""
+    result = queries @ matrix.T
+    return result.toarray() if sparse.issparse(result) else np.asarray(result)
+
+
+class JobMatcher:
+    """
+    Process-wide index of job vectors that a student document is matched against.
+
+    Backends differ only in how documents become vectors (`make_encoder()` /
+    `fit_encoder()` and `job_vectors()`); rows are always L2-normalised so a dot
+    product is the cosine similarity. Jobs posted afterwards are encoded and
+    appended, deleted jobs are dropped, so a query only encodes the student's own document.
+    - `version` is bumped on every change, `built_at` records the last full build.
+    - `refresh()` rebuilds when the table no longer matches the index (e.g. jobs
+      posted by another worker or by populate_db.py) or when `needs_refit()` says so.
+    """
+    name = None
+
+    def __init__(self, refresh_interval=60):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self.encoder = None
+        self.matrix = None
+        self.job_ids = np.empty(0, dtype=np.int64)
+        self.cgpa_required = np.empty(0, dtype=np.float64)
+        self.version = 0
+        self.built_at = None
+        self.checked_at = None
+        self.added_since_build = 0
+        self.ann = None  # Approximate nearest-neighbour index, for backends that build one
+
+    def fit_encoder(self, documents):
+        """Returns the encoder for a full rebuild; only backends with a fitted vocabulary use `documents`."""
+        return self.make_encoder()
+
+    def make_encoder(self):
+        raise NotImplementedError
+
+    def job_vectors(self, encoder, jobs):
+        """Vectors of `jobs` (rows with id, job_role, description, required_skills)."""
+        return encoder.transform([job_document(job) for job in jobs])
+
+    def needs_refit(self):
+        return False
+
+    def after_build(self):
+        """Hook run under the lock once the matrix changed wholesale (e.g. to rebuild an ANN index)."""
+
+    def rebuild(self):
+        """Encodes every job posting from scratch."""
+        jobs = JobPosting.query.with_entities(
+            JobPosting.id, JobPosting.job_role, JobPosting.description,
+            JobPosting.required_skills, JobPosting.cgpa_required
+        ).order_by(JobPosting.id).all()
+
+        encoder, matrix = None, None
+        if jobs:
+            try:
+                with timed(f'{self.name}_fit'):
+                    encoder = self.fit_encoder([job_document(job) for job in jobs])
+                    matrix = self.job_vectors(encoder, jobs)
+            except ValueError:
+                # TF-IDF: happens if no job has a single non stop-word token
+                encoder, matrix = None, None
+
+        with self._lock:
+            self.encoder = encoder
+            self.matrix = matrix
+            if matrix is not None:
+                self.job_ids = np.array([job.id for job in jobs], dtype=np.int64)
+                self.cgpa_required = np.array([job.cgpa_required or 0 for job in jobs], dtype=np.float64)
+            else:
+                self.job_ids = np.empty(0, dtype=np.int64)
+                self.cgpa_required = np.empty(0, dtype=np.float64)
+            self.added_since_build = 0
+            self.version += 1
+            self.built_at = datetime.utcnow()
+            self.checked_at = self.built_at
+            self.after_build()
+
+    def refresh(self, force=False):
+        """Rebuilds the index if it is stale; cheap enough to call on every query."""
+        now = datetime.utcnow()
+        if not force and self.checked_at and (now - self.checked_at).total_seconds() < self.refresh_interval:
+            return
+
+        count, max_id = db.session.query(func.count(JobPosting.id), func.max(JobPosting.id)).one()
+        with self._lock:
+            in_sync = count == len(self.job_ids) and max_id == (int(self.job_ids.max()) if len(self.job_ids) else None)
+            refit = self.needs_refit()
+            self.checked_at = now
+
+        if self.built_at is None or not in_sync or refit:
+            self.rebuild()
+
+    def add_job(self, job):
+        """Appends a newly posted job, reusing the current encoder."""
+        with self._lock:
+            if self.encoder is None:
+                # Nothing built yet, the next query builds the index from the table
+                self.built_at = None
+                return
+            if job.id in self.job_ids:
+                return
+            row = self.job_vectors(self.encoder, [job])
+            if sparse.issparse(self.matrix):
+                self.matrix = sparse.vstack([self.matrix, row], format='csr')
+            else:
+                self.matrix = np.vstack([self.matrix, row])
+            self.job_ids = np.append(self.job_ids, job.id)
+            self.cgpa_required = np.append(self.cgpa_required, job.cgpa_required or 0)
+            self.added_since_build += 1
+            self.version += 1
+
+    def remove_job(self, job_id):
+        """Drops a deleted job from the matrix."""
+        with self._lock:
+            if job_id not in self.job_ids:
+                return
+            keep = self.job_ids != job_id
+            self.matrix = self.matrix[keep]
+            self.job_ids = self.job_ids[keep]
+            self.cgpa_required = self.cgpa_required[keep]
+            self.version += 1
+
+    def score(self, document):
+        """
+        Returns (job_ids, cgpa_required, content_scores) for a query document.
+        Content scores are the cosine similarity of the document to every job, or to
+        the candidates of the approximate index when the backend has one.
+        """
+        with self._lock:
+            encoder, matrix, ann = self.encoder, self.matrix, self.ann
+            job_ids, cgpa_required = self.job_ids, self.cgpa_required
+
+        if encoder is None or not len(job_ids):
+            return job_ids, cgpa_required, np.empty(0)
+
+        with timed(f'{self.name}_transform'):
+            query = encoder.transform([document])
+        if ann is not None:
+            with timed('ann_search'):
+                positions = ann.candidates(query[0], job_ids)
+            job_ids, cgpa_required, matrix = job_ids[positions], cgpa_required[positions], matrix[positions]
+        with timed('cosine_similarity'):
+            content_scores = similarity(query, matrix)[0]
+        return job_ids, cgpa_required, content_scores
+
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': self.name,
+                'version': self.version,
+                'built_at': self.built_at.isoformat() if self.built_at else None,
+                'jobs': len(self.job_ids),
+                'added_since_build': self.added_since_build,
+            }
+
+
+class TfidfMatcher(JobMatcher):
+    """
+    TF-IDF over the job documents. The vocabulary is fitted on every rebuild; jobs added
+    later are transformed against it until more than `refit_ratio` of the index is new.
+    Only exact tokens match ("React Native" and "mobile development" share nothing).
+    """
+    name = 'tfidf'
+
+    def __init__(self, refresh_interval=60, refit_ratio=0.2):
+        super().__init__(refresh_interval)
+        self.refit_ratio = refit_ratio
+
+    def fit_encoder(self, documents):
+        vectorizer = TfidfVectorizer(stop_words='english')
+        vectorizer.fit(documents)
+        return vectorizer
+
+    def needs_refit(self):
+        # The vocabulary drifts as jobs are added without refitting
+        return self.added_since_build > self.refit_ratio * max(len(self.job_ids), 1)
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            stats['vocabulary'] = len(self.encoder.vocabulary_) if self.encoder is not None else 0
+        return stats
+
+
+class HashedNgramEncoder:
+    """
+    Dense embedding without a model: word uni/bigrams and character 3-5 grams are hashed
+    into a sparse space and squeezed to `dimensions` by a seeded sparse random projection.
+    Stateless and deterministic, so vectors stored by one process are valid in every other.
+    Shared character n-grams give partial credit to near spellings ("ReactJS" / "React").
+    """
+    def __init__(self, dimensions=256, n_features=2 ** 18, seed=0):
+        self.dimensions = dimensions
+        self.signature = f"{dimensions}d-{n_features}f-seed{seed}"
+        self.words = HashingVectorizer(analyzer='word', ngram_range=(1, 2), n_features=n_features,
+                                       stop_words='english', alternate_sign=True, norm='l2')
+        self.chars = HashingVectorizer(analyzer='char_wb', ngram_range=(3, 5), n_features=n_features,
+                                       alternate_sign=True, norm='l2')
+        self.projection = SparseRandomProjection(n_components=dimensions, random_state=seed, dense_output=True)
+        self.projection.fit(sparse.csr_matrix((1, 2 * n_features)))
+
+    def transform(self, documents):
+        features = sparse.hstack([self.words.transform(documents), self.chars.transform(documents)], format='csr')
+        return normalize_rows(self.projection.transform(features).astype(np.float32))
+
+
+class SentenceTransformerEncoder:
+    """
+    Local sentence-embedding model on the CPU, e.g. all-MiniLM-L6-v2 (needs the optional
+    sentence-transformers package and the model in its local cache; nothing is downloaded).
+    Pickles by model name so worker processes load their own copy.
+    """
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.signature = model_name
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device='cpu', local_files_only=True)
+        return self._model
+
+    @property
+    def dimensions(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def transform(self, documents):
+        vectors = self.model.encode(list(documents), batch_size=64, normalize_embeddings=True,
+                                    convert_to_numpy=True, show_progress_bar=False)
+        return vectors.astype(np.float32)
+
+    def __getstate__(self):
+        return {'model_name': self.model_name, 'signature': self.signature, '_model': None}
+
+
+def normalize_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+class IVFIndex:
+    """
+    Inverted-file approximate nearest-neighbour index over L2-normalised dense vectors.
+    Spherical k-means splits the jobs into ~sqrt(N) lists; a query only scores the
+    jobs in its `nprobe` closest lists. Lists hold job ids, so jobs removed from the
+    matcher are simply filtered out, and new jobs join the list of their closest centroid.
+    """
+    def __init__(self, vectors, job_ids, nprobe=8, nlist=None, iterations=10, seed=0):
+        self.nprobe = nprobe
+        nlist = nlist or max(1, int(np.sqrt(len(vectors))))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = self._assign(vectors, centroids)
+            for cluster in range(nlist):
+                members = vectors[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = normalize_rows(centroids)
+        self.centroids = centroids
+        assignment = self._assign(vectors, centroids)
+        self.lists = [list(job_ids[assignment == cluster]) for cluster in range(nlist)]
+
+    @staticmethod
+    def _assign(vectors, centroids, chunk_size=10000):
+        return np.concatenate([
+            np.argmax(vectors[start:start + chunk_size] @ centroids.T, axis=1)
+            for start in range(0, len(vectors), chunk_size)
+        ]) if len(vectors) else np.empty(0, dtype=np.int64)
+
+    def add(self, job_id, vector):
+        self.lists[int(np.argmax(self.centroids @ vector))].append(job_id)
+
+    def search(self, query):
+        """Job ids in the `nprobe` lists closest to the query vector."""
+        closest = np.argsort(self.centroids @ query)[::-1][:self.nprobe]
+        ids = [job_id for cluster in closest for job_id in self.lists[cluster]]
+        return np.array(ids, dtype=np.int64)
+
+    def candidates(self, query, job_ids):
+        """Positions in the sorted `job_ids` array of the jobs to score exactly."""
+        ids = self.search(query)
+        return np.unique(np.searchsorted(job_ids, ids[np.isin(ids, job_ids)]))
+
+
+class EmbeddingMatcher(JobMatcher):
+    """
+    Dense embeddings whose job vectors are computed once and stored in job_embedding,
+    so a rebuild only encodes the jobs that have none yet. Above `ann_min_jobs` jobs an
+    IVFIndex narrows each query to a fraction of the postings.
+    """
+    def __init__(self, encoder, name, refresh_interval=60, ann_min_jobs=5000, ann_nprobe=8):
+        super().__init__(refresh_interval)
+        self.name = name
+        # Vectors are only reused by a matcher with the same encoder settings
+        self.storage_key = f"{name}:{encoder.signature}"[:120]
+        self._encoder = encoder
+        self.ann_min_jobs = ann_min_jobs
+        self.ann_nprobe = ann_nprobe
+
+    def make_encoder(self):
+        return self._encoder
+
+    def job_vectors(self, encoder, jobs):
+        """Loads stored vectors, encoding (and storing) the jobs that have none."""
+        job_ids = [job.id for job in jobs]
+        stored = {}
+        for start in range(0, len(job_ids), 5000):
+            rows = db.session.query(JobEmbedding.job_id, JobEmbedding.vector).filter(
+                JobEmbedding.backend == self.storage_key, JobEmbedding.job_id.in_(job_ids[start:start + 5000]))
+            stored.update({job_id: np.frombuffer(vector, dtype=np.float32) for job_id, vector in rows})
+
+        missing = [job for job in jobs if job.id not in stored]
+        if missing:
+            encoded = encoder.transform([job_document(job) for job in missing])
+            self.store_vectors([job.id for job in missing], encoded)
+            stored.update({job.id: vector for job, vector in zip(missing, encoded)})
+        return np.vstack([stored[job_id] for job_id in job_ids]).astype(np.float32)
+
+    def store_vectors(self, job_ids, vectors):
+        """
+        Saves job vectors in their own transaction on the primary, so that building the index
+        inside a request neither commits nor expires that request's session. Vectors another
+        worker stored first are kept.
+        """
+        table = JobEmbedding.__table__
+        rows = [{'job_id': job_id, 'backend': self.storage_key, 'vector': vector.astype(np.float32).tobytes(),
+                 'created_at': datetime.utcnow()} for job_id, vector in zip(job_ids, vectors)]
+        with db.engine.begin() as connection:
+            dialect = connection.dialect.name
+            if dialect == 'mysql':
+                stmt = mysql.insert(table).prefix_with('IGNORE')
+            elif dialect in ('sqlite', 'postgresql'):
+                stmt = (sqlite.insert if dialect == 'sqlite' else postgresql.insert)(table).on_conflict_do_nothing()
+            else:
+                stmt = table.insert()
+            for start in range(0, len(rows), 5000):
+                connection.execute(stmt, rows[start:start + 5000])
+
+    def after_build(self):
+        self.ann = None
+        if self.matrix is not None and len(self.job_ids) >= self.ann_min_jobs:
+            self.ann = IVFIndex(self.matrix, self.job_ids, nprobe=self.ann_nprobe)
+
+    def add_job(self, job):
+        super().add_job(job)
+        with self._lock:
+            if self.ann is not None and len(self.job_ids) and self.job_ids[-1] == job.id:
+                self.ann.add(job.id, self.matrix[-1])
+
+    def stats(self):
+        stats = super().stats()
+        with self._lock:
+            stats['ann_lists'] = len(self.ann.lists) if self.ann is not None else 0
+        return stats
+
+
+class StudentIndex:
+    """
+    Every student's document encoded with a JobMatcher's current encoder, so one job
+    posting is scored against thousands of students in a single product (rank_candidates()).
+    - Rebuilt when the matcher's encoder changes (a TF-IDF refit) and after `max_age`
+      seconds, which is how profile edits made on other workers show up.
+    - Students passed to `invalidate()` are re-encoded on the next refresh; students
+      registered since the last check are appended every `refresh_interval` seconds.
+    """
+    def __init__(self, matcher, refresh_interval=60, max_age=600):
+        self.matcher = matcher
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self.encoder = None
+        self.matrix = None
+        self.student_ids = np.empty(0, dtype=np.int64)
+        self.cgpa = np.empty(0, dtype=np.float64)
+        self.colleges = np.empty(0, dtype=object)
+        self.built_at = None
+        self.checked_at = None
+        self.stale = set()
+
+    @staticmethod
+    def load(after_id=0, student_ids=None):
+        """
+        (ids, cgpa, colleges, documents) of the students with an id above `after_id`, or of
+        `student_ids`, in id order. Reads columns only; documents match student_document().
+        """
+        students = db.session.query(Student.id, Student.cgpa, Student.college, Student.skills)
+        projects = db.session.query(StudentProject.student_id, StudentProject.description)
+        if student_ids is not None:
+            students = students.filter(Student.id.in_(student_ids))
+            projects = projects.filter(StudentProject.student_id.in_(student_ids))
+        else:
+            students = students.filter(Student.id > after_id)
+            projects = projects.filter(StudentProject.student_id > after_id)
+
+        descriptions = defaultdict(list)
+        for student_id, description in projects.order_by(StudentProject.id):
+            if description:
+                descriptions[student_id].append(description)
+        rows = students.order_by(Student.id).all()
+        documents = [f"{' '.join(row.skills or [])} {' '.join(descriptions[row.id])}" for row in rows]
+        return [row.id for row in rows], [row.cgpa or 0 for row in rows], [row.college for row in rows], documents
+
+    def rebuild(self):
+        """Encodes every student from scratch with the matcher's current encoder."""
+        encoder = self.matcher.encoder
+        with self._lock:
+            self.stale.clear()
+        ids, cgpa, colleges, documents = self.load() if encoder is not None else ([], [], [], [])
+        matrix = None
+        if ids:
+            with timed('student_index_build'):
+                matrix = encoder.transform(documents)
+
+        with self._lock:
+            self.encoder = encoder
+            self.matrix = matrix
+            if matrix is None:
+                ids, cgpa, colleges = [], [], []
+            self.student_ids = np.array(ids, dtype=np.int64)
+            self.cgpa = np.array(cgpa, dtype=np.float64)
+            self.colleges = np.array(colleges, dtype=object)
+            self.built_at = datetime.utcnow()
+            self.checked_at = self.built_at
+
+    def refresh(self, include=None):
+        """Rebuilds or patches the index if needed; `include` are student ids that must be indexed."""
+        now = datetime.utcnow()
+        with self._lock:
+            if include is not None:
+                self.stale.update(int(student_id) for student_id in np.setdiff1d(include, self.student_ids))
+            expired = (self.built_at is None or self.matrix is None or self.encoder is not self.matcher.encoder
+                       or (now - self.built_at).total_seconds() >= self.max_age)
+            due = self.checked_at is None or (now - self.checked_at).total_seconds() >= self.refresh_interval
+            if not expired and not due and not self.stale:
+                return
+            stale, self.stale = self.stale, set()
+            if due:
+                self.checked_at = now
+            last_id = int(self.student_ids[-1]) if len(self.student_ids) else 0
+
+        if expired:
+            self.rebuild()
+            return
+        if stale:
+            self._merge(*self.load(student_ids=sorted(stale)), replace=stale)
+        if due:
+            self._merge(*self.load(after_id=last_id))
+
+    def _merge(self, ids, cgpa, colleges, documents, replace=()):
+        """Drops the rows of `replace` and adds the given students, keeping the rows in id order."""
+        vectors = self.encoder.transform(documents) if ids else None
+        with self._lock:
+            keep = ~np.isin(self.student_ids, list(replace) + ids)
+            if vectors is None and keep.all():
+                return
+            parts = [self.matrix[keep]] + ([vectors] if vectors is not None else [])
+            matrix = sparse.vstack(parts, format='csr') if sparse.issparse(self.matrix) else np.vstack(parts)
+            student_ids = np.concatenate([self.student_ids[keep], np.array(ids, dtype=np.int64)])
+            order = np.argsort(student_ids, kind='stable')
+            self.matrix = matrix[order]
+            self.student_ids = student_ids[order]
+            self.cgpa = np.concatenate([self.cgpa[keep], np.array(cgpa, dtype=np.float64)])[order]
+            self.colleges = np.concatenate([self.colleges[keep], np.array(colleges, dtype=object)])[order]
+
+    def invalidate(self, student_id):
+        with self._lock:
+            self.stale.add(student_id)
+
+    def snapshot(self):
+        with self._lock:
+            return self.encoder, self.matrix, self.student_ids, self.cgpa, self.colleges
+
+    def stats(self):
+        with self._lock:
+            return {
+                'students': len(self.student_ids),
+                'built_at': self.built_at.isoformat() if self.built_at else None,
+            }
+
+
+def make_matcher(config, backend=None):
+    """Builds the matcher named by `backend`, by default the app's RECOMMENDATION_BACKEND."""
+    backend = backend or config['RECOMMENDATION_BACKEND']
+    refresh_interval = config['JOB_INDEX_REFRESH_SECONDS']
+    if backend == 'tfidf':
+        return TfidfMatcher(refresh_interval=refresh_interval)
+    if backend == 'hashed_ngram':
+        encoder = HashedNgramEncoder(dimensions=config['EMBEDDING_DIMENSIONS'])
+    elif backend == 'sentence_transformer':
+        encoder = SentenceTransformerEncoder(config['EMBEDDING_MODEL'])
+    else:
+        raise ValueError(f"Unknown RECOMMENDATION_BACKEND {backend!r}")
+    return EmbeddingMatcher(encoder, backend, refresh_interval=refresh_interval,
+                            ann_min_jobs=config['ANN_MIN_JOBS'], ann_nprobe=config['ANN_NPROBE'])
+
+
+def hybrid_scores(content_scores, student_cgpa, cgpa_required):
+    """
+    Vectorised hybrid score for one student against many jobs.
+    - 70% weight on content similarity.
+    - 30% weight on CGPA match (full marks when the student meets the cut-off,
+      partial marks proportional to student_cgpa / cgpa_required otherwise).
+    """
+    scores = np.asarray(content_scores, dtype=np.float64) * 70
+    if student_cgpa:
+        ratio = np.divide(student_cgpa, cgpa_required,
+                          out=np.zeros_like(cgpa_required), where=cgpa_required > 0)
+        scores += np.clip(ratio, 0, 1) * 30
+    return scores
+
+
+def candidate_scores(content_scores, student_cgpa, cgpa_required):
+    """
+    hybrid_scores() the other way round: one job against many students, with the same
+    weights, given each student's content similarity and CGPA.
+    """
+    scores = np.asarray(content_scores, dtype=np.float64) * 70
+    if cgpa_required and cgpa_required > 0:
+        scores += np.clip(np.asarray(student_cgpa, dtype=np.float64) / cgpa_required, 0, 1) * 30
+    return scores
+
+
+def top_k(scores, k, min_score=None, exclude=None):
+    """
+    Returns the positions of the k best scores, best first.
+    Positions masked by the boolean `exclude` array or scoring <= min_score are skipped.
+    """
+    candidates = np.ones(len(scores), dtype=bool)
+    if exclude is not None:
+        candidates &= ~exclude
+    if min_score is not None:
+        candidates &= scores > min_score
+
+    positions = np.flatnonzero(candidates)
+    if k < len(positions):
+        # Partial sort: only the k best candidates end up in front, unordered
+        positions = positions[np.argpartition(scores[positions], -k)[-k:]]
+    return positions[np.argsort(scores[positions])[::-1]]
+
+
+def recommend_jobs(matcher, student, k, min_score):
+    """Runs the hybrid model for `student`; returns [(job_id, score), ...] best first."""
+    applied_job_ids = [application.job_id for application in student.applications]
+
+    # --- Cosine Similarity against the cached job index ---
+    matcher.refresh()
+    job_ids, cgpa_required, content_scores = matcher.score(student_document(student))
+
+    if not len(job_ids):
+        return []
+
+    # --- Hybrid Scoring ---
+    with timed('scoring'):
+        scores = hybrid_scores(content_scores, student.cgpa, cgpa_required)
+        best = top_k(scores, k, min_score=min_score, exclude=np.isin(job_ids, applied_job_ids))
+    return [(int(job_ids[i]), round(float(scores[i]), 2)) for i in best]
+
+
+def rank_candidates(students, job, student_ids=None, college=None, k=20, offset=0):
+    """
+    Ranks students for `job` with the content + CGPA model of recommend_jobs(), in one pass
+    over the StudentIndex. `student_ids` limits the pool (e.g. to the applicants); without it
+    every student meeting the CGPA cut-off is a candidate. `college` narrows the pool further.
+    Returns (number of candidates, [(student_id, score), ...] for ranks offset+1 .. offset+k).
+    """
+    students.matcher.refresh()
+    students.refresh(include=student_ids)
+    encoder, matrix, ids, cgpa, colleges = students.snapshot()
+    if encoder is None or matrix is None:
+        return 0, []
+
+    pool = np.ones(len(ids), dtype=bool)
+    if student_ids is not None:
+        pool &= np.isin(ids, student_ids)
+    elif job.cgpa_required:
+        pool &= cgpa >= job.cgpa_required
+    if college:
+        pool &= colleges == college
+    positions = np.flatnonzero(pool)
+    if not len(positions) or offset >= len(positions):
+        return len(positions), []
+
+    with timed(f'{students.matcher.name}_transform'):
+        query = encoder.transform([job_document(job)])
+    with timed('candidate_scoring'):
+        content_scores = similarity(query, matrix[positions] if len(positions) < len(ids) else matrix)[0]
+        scores = candidate_scores(content_scores, cgpa[positions], job.cgpa_required)
+        best = top_k(scores, offset + k)[offset:]
+    return len(positions), [(int(ids[positions[i]]), round(float(scores[i]), 2)) for i in best]
@@ -0,0 +1,49 @@
+import os
+import sys
+
+# The app modules live next to this folder and are imported as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from flask import g
+
+from app import create_app, db
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'PASSWORD_HASH_WORKERS': 0,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def statements(app):
+    """SQL statements of each request made through the test client, as counted by instrumentation.py."""
+    counts = []
+
+    @app.after_request
+    def record_statements(response):
+        counts.append(g.sql_statements)
+        return response
+
+    return counts
+
+
+@pytest.fixture
+def client(app, statements):
+    return app.test_client()
+
+
+def log_in(client, **values):
+    with client.session_transaction() as sess:
+        sess.clear()
+        sess.update(logged_in=True, **values)
@@ -0,0 +1,25 @@
+import app as app_module
+from app import create_app
+
+
+EXTENSIONS = ('asset_manifest', 'fragment_cache', 'recommendation_cache', 'password_hasher', 'request_metrics')
+
+
+def test_importing_the_app_module_builds_no_app():
+    assert not hasattr(app_module, 'app')
+
+
+def test_each_app_gets_its_own_caches_and_settings(tmp_path):
+    first = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'first.db'}",
+                        'RECOMMENDATION_CACHE_SIZE': 10, 'PASSWORD_HASH_WORKERS': 0})
+    second = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'second.db'}",
+                         'RECOMMENDATION_CACHE_SIZE': 20, 'PASSWORD_HASH_WORKERS': 1})
+
+    for name in EXTENSIONS:
+        assert first.extensions[name] is not second.extensions[name]
+    # Building the second app left the first one's settings alone
+    assert first.extensions['recommendation_cache'].max_entries == 10
+    assert first.extensions['password_hasher'].workers == 0
+
+    first.extensions['recommendation_cache'].set(1, (10, 0), [(1, 90.0)])
+    assert second.extensions['recommendation_cache'].get(1, (10, 0)) is None
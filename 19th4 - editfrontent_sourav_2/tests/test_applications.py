@@ -0,0 +1,24 @@
+"""Applying to jobs from the recommendations list (/apply_jobs)."""
+from app import db, Company, JobApplication, JobPosting, Student, BPUT_COLLEGES
+from conftest import log_in
+
+
+def test_only_posted_jobs_are_applied_to(app, client):
+    with app.app_context():
+        company = Company(company_name='Acme', email='acme@test.in', password_hash='x')
+        jobs = [JobPosting(company=company, job_role=f"Role {i}", required_skills=[], cgpa_required=6.0,
+                           location='Pune', description='') for i in range(3)]
+        student = Student(full_name='Student', email='student@test.in', college=BPUT_COLLEGES[0],
+                          registration_number='R1', password_hash='x', skills=[])
+        db.session.add_all(jobs + [student])
+        db.session.commit()
+        job_ids, student_id = [job.id for job in jobs], student.id
+        db.session.delete(jobs[2])
+        db.session.commit()
+
+    log_in(client, role='student', user_id=student_id)
+    client.post('/apply_jobs', data={'job_ids': job_ids + [job_ids[0], 9999]})
+
+    with app.app_context():
+        applied = {job_id for (job_id,) in db.session.query(JobApplication.job_id)}
+    assert applied == set(job_ids[:2])
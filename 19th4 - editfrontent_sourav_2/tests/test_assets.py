@@ -0,0 +1,15 @@
+"""Fingerprinted /assets/ URLs and their precompressed copies."""
+from app import asset_url_for
+
+
+def test_compressed_copy_keeps_the_asset_name(app, client):
+    with app.test_request_context():
+        url = asset_url_for('static', filename='css/rev.css')
+    assert url.startswith('/assets/css/rev.')
+
+    for encoding in (None, 'gzip'):
+        response = client.get(url, headers={'Accept-Encoding': encoding} if encoding else {})
+        assert response.status_code == 200
+        assert response.headers.get('Content-Encoding') == encoding
+        assert response.headers['Content-Disposition'] == 'inline; filename=rev.css'
+        assert response.mimetype == 'text/css'
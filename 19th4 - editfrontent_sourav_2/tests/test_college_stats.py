@@ -0,0 +1,92 @@
+"""The college_stats counters behind the university dashboard (USE_COLLEGE_STATS_TABLE)."""
+from app import db, Company, CollegeStats, JobPosting, BPUT_COLLEGES, rebuild_college_stats
+from conftest import log_in
+
+COLLEGE = BPUT_COLLEGES[0]
+
+
+def college_counts(app):
+    with app.app_context():
+        stats = db.session.get(CollegeStats, COLLEGE)
+        return (stats.total_students, stats.placed_students) if stats else None
+
+
+def add_jobs(app, count):
+    with app.app_context():
+        company = Company(company_name='Acme', email='acme@test.in', password_hash='x')
+        jobs = [JobPosting(company=company, job_role=f"Role {i}", required_skills=[], cgpa_required=6.0,
+                           location='Pune', description='') for i in range(count)]
+        db.session.add_all(jobs)
+        db.session.commit()
+        return company.id, [job.id for job in jobs]
+
+
+def register(client, n):
+    client.post('/student_register', data={'full_name': f"Student {n}", 'email': f"s{n}@test.in",
+                                           'college': COLLEGE, 'registration_number': f"R{n}", 'password': 'pw'})
+
+
+def rebuild(app):
+    with app.app_context():
+        rebuild_college_stats()
+
+
+def dashboard_counts(client):
+    """(registered, placed) of COLLEGE as shown on the university dashboard."""
+    log_in(client, role='university', user_id=1, username='admin')
+    page = client.get('/university_dashboard').get_data(as_text=True)
+    row = page.split(f"<td>{COLLEGE}</td>", 1)[1].split('</tr>', 1)[0]
+    return tuple(int(cell.split('</td>')[0]) for cell in row.split('<td>')[1:3])
+
+
+def test_counters_follow_applications_and_deleted_jobs(app, client):
+    app.config['USE_COLLEGE_STATS_TABLE'] = True
+    rebuild(app)
+    assert college_counts(app) == (0, 0)
+    company_id, (first_job, second_job) = add_jobs(app, 2)
+    register(client, 1)
+    register(client, 2)
+    assert college_counts(app) == (2, 0)
+
+    # Student 2 is logged in after registering; only their first application places them
+    client.get(f'/apply_job/{first_job}')
+    client.get(f'/apply_job/{second_job}')
+    client.get(f'/apply_job/{second_job}')
+    assert college_counts(app) == (2, 1)
+
+    log_in(client, role='company', user_id=company_id)
+    client.get(f'/delete_job/{first_job}')
+    assert college_counts(app) == (2, 1)
+    client.get(f'/delete_job/{second_job}')
+    assert college_counts(app) == (2, 0)
+
+
+def test_colleges_without_a_row_are_counted_live(app, client):
+    _, (job,) = add_jobs(app, 1)
+    register(client, 1)
+    client.get(f'/apply_job/{job}')
+
+    # Switched on before rebuild_college_stats.py ran: nothing is written, the dashboard aggregates
+    app.config['USE_COLLEGE_STATS_TABLE'] = True
+    register(client, 2)
+    client.get(f'/apply_job/{job}')
+    register(client, 3)
+    assert college_counts(app) is None
+    assert dashboard_counts(client) == (3, 2)
+
+    rebuild(app)
+    assert college_counts(app) == (3, 2)
+    register(client, 4)
+    assert dashboard_counts(client) == (4, 2)
+
+
+def test_university_dashboard_does_not_write(app, client):
+    app.config['USE_COLLEGE_STATS_TABLE'] = True
+    register(client, 1)
+    rebuild(app)
+    with app.app_context():
+        db.session.delete(db.session.get(CollegeStats, COLLEGE))
+        db.session.commit()
+
+    assert dashboard_counts(client) == (1, 0)
+    assert college_counts(app) is None
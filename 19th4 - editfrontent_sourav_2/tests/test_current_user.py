@@ -0,0 +1,49 @@
+"""
+current_user() is loaded once per request; it must follow the session even when the requests
+share one app context, as they do under a CLI script, a benchmark or a test's app_context().
+"""
+from app import db, Student, StudentProject, Company, JobPosting, BPUT_COLLEGES
+from conftest import log_in
+
+
+def add_students(app, count):
+    with app.app_context():
+        company = Company(company_name='Acme', email='acme@test.in', password_hash='x')
+        db.session.add_all([
+            JobPosting(company=company, job_role=f"Python developer {i}", required_skills=['python', 'sql'],
+                       cgpa_required=6.0, location='Pune', description='Backend work') for i in range(10)
+        ])
+        for i in range(count):
+            student = Student(full_name=f"Student {i}", email=f"student{i}@test.in", college=BPUT_COLLEGES[0],
+                              registration_number=f"R{i}", password_hash='x', cgpa=8.0, skills=['python'])
+            student.projects = [StudentProject(project_title=f"Project of student {i}", description='')]
+            db.session.add(student)
+        db.session.commit()
+        return [student.id for student in Student.query.order_by(Student.id)]
+
+
+def test_each_request_gets_its_own_user_in_a_shared_app_context(app, client):
+    first, second = add_students(app, 2)
+
+    with app.app_context():
+        log_in(client, role='student', user_id=first)
+        assert 'Project of student 0' in client.get('/student_profile').get_data(as_text=True)
+
+        log_in(client, role='student', user_id=second)
+        page = client.get('/student_profile').get_data(as_text=True)
+        assert 'Project of student 1' in page and 'Project of student 0' not in page
+
+        log_in(client, role='company', user_id=1)
+        assert client.get('/company_profile').status_code == 200
+
+
+def test_student_profile_statements(app, client, statements):
+    student_id, = add_students(app, 1)
+    log_in(client, role='student', user_id=student_id)
+    client.get('/student_profile')  # Builds the job index
+
+    statements.clear()
+    for _ in range(2):
+        assert client.get('/student_profile').status_code == 200
+    # The student with projects, their applications, the precomputed list and the recommended jobs
+    assert max(statements) <= 4
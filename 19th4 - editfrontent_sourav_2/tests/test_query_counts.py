@@ -0,0 +1,108 @@
+"""
+Bounds on the SQL statements per request of the pages that used to issue one query per row.
+Each test loads a page, adds more rows and checks the count did not grow with them.
+"""
+from app import db, Student, Company, JobPosting, JobApplication, BPUT_COLLEGES
+from conftest import log_in
+
+COLLEGE = BPUT_COLLEGES[0]
+OTHER_COLLEGE = BPUT_COLLEGES[1]
+
+
+def add_students(app, count, college, applications_each, start=0):
+    with app.app_context():
+        company = Company.query.first() or Company(company_name='Acme', email='acme@test.in', password_hash='x')
+        jobs = JobPosting.query.all() or [
+            JobPosting(company=company, job_role=f"Role {i}", required_skills=['python'], cgpa_required=6.0,
+                       location='Pune', description='') for i in range(5)
+        ]
+        db.session.add_all(jobs)
+        for i in range(start, start + count):
+            student = Student(full_name=f"Student {i}", email=f"student{i}@test.in", college=college,
+                              registration_number=f"R{i}", password_hash='x', cgpa=7.0, skills=[])
+            student.applications = [JobApplication(job_posting=job) for job in jobs[:applications_each]]
+            db.session.add(student)
+        db.session.commit()
+
+
+def test_college_dashboard_statements_do_not_grow_with_students(app, client, statements):
+    add_students(app, 5, COLLEGE, applications_each=2)
+    log_in(client, role='college', user_id=1, username='admin', college_name=COLLEGE)
+
+    for sort in ('name', 'cgpa', 'applications'):
+        assert client.get(f'/college_dashboard?sort={sort}').status_code == 200
+    few = list(statements)
+
+    add_students(app, 60, COLLEGE, applications_each=3, start=100)
+    add_students(app, 60, OTHER_COLLEGE, applications_each=5, start=200)
+    statements.clear()
+    for sort in ('name', 'cgpa', 'applications'):
+        assert client.get(f'/college_dashboard?sort={sort}').status_code == 200
+
+    # One count for the pagination and one for the page of students with their application counts
+    assert statements == few
+    assert max(statements) <= 2
+
+
+def test_college_dashboard_counts_applications(app, client):
+    add_students(app, 2, COLLEGE, applications_each=3)
+    add_students(app, 2, OTHER_COLLEGE, applications_each=5, start=10)
+    log_in(client, role='college', user_id=1, username='admin', college_name=COLLEGE)
+
+    page = client.get('/college_dashboard?sort=applications&order=desc').get_data(as_text=True)
+    assert 'Student 0' in page and 'Student 10' not in page
+    assert '<td>3</td>' in page and '<td>5</td>' not in page
+
+
+def add_company_jobs(app, company_id, jobs, applicants_each, start=0):
+    """Adds `jobs` postings to the company, each with `applicants_each` new students applied."""
+    with app.app_context():
+        company = db.session.get(Company, company_id) or Company(
+            id=company_id, company_name=f"Company {company_id}", email=f"c{company_id}@test.in", password_hash='x')
+        for i in range(start, start + jobs):
+            job = JobPosting(company=company, job_role=f"Role {i}", required_skills=['python'], cgpa_required=6.0,
+                             location='Pune', description='')
+            job.applications = [JobApplication(student=Student(
+                full_name=f"Student {i}-{n}", email=f"s{i}-{n}@test.in", college=COLLEGE,
+                registration_number=f"R{i}-{n}", password_hash='x', cgpa=8.0, skills=['python']
+            )) for n in range(applicants_each)]
+            db.session.add(job)
+        db.session.commit()
+
+
+def test_company_profile_statements_do_not_grow_with_postings(app, client, statements):
+    add_company_jobs(app, 1, jobs=2, applicants_each=2)
+    log_in(client, role='company', user_id=1)
+    assert client.get('/company_profile').status_code == 200
+    few = statements[-1]
+
+    add_company_jobs(app, 1, jobs=20, applicants_each=5, start=100)
+    add_company_jobs(app, 2, jobs=20, applicants_each=5, start=200)
+    assert client.get('/company_profile').status_code == 200
+    page = client.get('/company_profile').get_data(as_text=True)
+
+    # The company and its postings with their applicant counts
+    assert statements[-1] == few <= 2
+    assert 'Role 100' in page and 'Role 200' not in page
+
+
+def test_applicants_statements_do_not_grow_with_applicants(app, client, statements):
+    add_company_jobs(app, 1, jobs=1, applicants_each=3)
+    log_in(client, role='company', user_id=1)
+    for query in ('?sort=applied', '', '?pool=eligible'):
+        client.get(f'/applicants/1{query}')  # Builds the student index on the first ranked page
+        statements.clear()
+        assert client.get(f'/applicants/1{query}').status_code == 200
+        few = statements[-1]
+
+        with app.app_context():
+            job = db.session.get(JobPosting, 1)
+            job.applications.extend(JobApplication(student=Student(
+                full_name=f"Late {query} {n}", email=f"late{query}{n}@test.in", college=COLLEGE,
+                registration_number=f"L{len(query)}{n}", password_hash='x', cgpa=8.0, skills=['python']
+            )) for n in range(40))
+            db.session.commit()
+        client.get(f'/applicants/1{query}')  # Adds the new students to the student index
+        statements.clear()
+        assert client.get(f'/applicants/1{query}').status_code == 200
+        assert statements[-1] == few <= 4, query
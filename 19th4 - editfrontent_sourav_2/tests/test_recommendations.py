@@ -0,0 +1,32 @@
+"""The per-worker recommendation cache."""
+from app import db, Company, JobPosting, Student, BPUT_COLLEGES, get_recommendations
+
+
+def test_profile_edit_from_another_worker_is_not_served_from_the_cache(app):
+    with app.app_context():
+        company = Company(company_name='Acme', email='acme@test.in', password_hash='x')
+        db.session.add_all([
+            JobPosting(company=company, job_role=f"{skill} developer {i}", required_skills=[skill], cgpa_required=6.0,
+                       location='Pune', description=f"{skill} work") for skill in ('python', 'java') for i in range(3)
+        ])
+        student = Student(full_name='Student', email='student@test.in', college=BPUT_COLLEGES[0],
+                          registration_number='R1', password_hash='x', cgpa=8.0, skills=['python'])
+        db.session.add(student)
+        db.session.commit()
+        student_id = student.id
+
+    def recommended_roles():
+        with app.test_request_context():
+            return {item['job'].job_role.split()[0] for item in get_recommendations(student_id, k=3)}
+
+    cache = app.extensions['recommendation_cache']
+    assert recommended_roles() == {'python'}
+    assert recommended_roles() == {'python'}
+    assert cache.stats()['hits'] == 1
+
+    # Another worker saved the edit and invalidated only its own cache
+    with app.app_context():
+        Student.query.filter_by(id=student_id).update({Student.skills: ['java']})
+        db.session.commit()
+    assert recommended_roles() == {'java'}
+    assert cache.stats()['hits'] == 1